@@ -3,42 +3,71 @@
 
 from chat.common.config import Config
 from chat.common.operations import Opcode
-from typing import Callable
+from collections import defaultdict
+from typing import Callable, Optional
 
 import datetime
+import functools
+import sys
 import threading
 
 
+# the menu prompts printed on every iteration of the `main` loops.
+_LOGIN_PROMPT = ('Do you want to...\n'
+                 '1) Log In\n'
+                 '2) Sign Up\n')
+
+_MENU_PROMPT = ('Do you want to...\n'
+                '1) List Accounts\n'
+                '2) Send a Message\n'
+                '3) Deliver Undelivered Messages\n'
+                '4) Delete Account\n'
+                '5) Log Out\n')
+
 timer = None
 
 
+def read_piped(prompt: str = '') -> str:
+    """Like `input`, but reading straight from `sys.stdin` without the
+        readline machinery, for when it is not a TTY (e.g. when the client
+        is scripted through a pipe). Raises `EOFError` at the end of input.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+class RepeatTimer(threading.Timer):
+    """A `threading.Timer` which keeps calling its `function` every
+        `interval` on the same thread, until it is cancelled (rather than
+        starting a new `threading.Timer` for every call).
+    """
+
+    def run(self):
+        while not self.finished.wait(self.interval):
+            self.function(*self.args, **self.kwargs)
+
+
 def print_messages(messages=None, **kwargs):
     """Prints some `Message`s to the console.
     """
-    formatted_messages = ""
-
     # Create a dictionary to group messages by sender
-    grouped_messages = {}
+    grouped_messages = defaultdict(list)
     for message in messages:
-        sender = message.get_sender_username()
-        if sender in grouped_messages:
-            grouped_messages[sender].append((message.get_time(),
-                                             message.get_message()))
-        else:
-            grouped_messages[sender] = [(message.get_time(),
-                                         message.get_message())]
-
-    # Iterate over the grouped messages and format them
-    for sender, messages in grouped_messages.items():
-        messages.sort(key=lambda t_msg: t_msg[0])
-        formatted_messages += f'\n> {sender}\n'
-        for t, message in messages:
-            formatted_messages += (datetime.datetime.fromtimestamp(t)
-                                   .isoformat(sep=' '))
-            formatted_messages += f' {message}\n'
-
-    # Remove the trailing newline character
-    formatted_messages = formatted_messages[:-1]
+        grouped_messages[message.get_sender_username()].append(
+            (message.get_time(), message.get_message()))
+
+    # Format the grouped messages, with each sender's sorted by time
+    formatted_messages = '\n'.join(
+        f'\n> {sender!s}\n' +
+        '\n'.join(f'{datetime.datetime.fromtimestamp(t).isoformat(sep=" ")}'
+                  f' {message!s}'
+                  for t, message in sorted(sender_messages,
+                                           key=lambda t_msg: t_msg[0]))
+        for sender, sender_messages in grouped_messages.items())
 
     print(f'{formatted_messages!s}\n\n...', end="")
 
@@ -63,22 +92,154 @@ def poll(request: Callable = None, username: str = None, **kwargs):
 
         print_messages(messages=messages)
 
-    create_poll(request=request, username=username, **kwargs)
-
 
 def create_poll(request: Callable = None, username: str = None, **kwargs):
-    """Creates the background polling `threading.Timer` that will execute
-        `poll`.
+    """Creates the background polling `RepeatTimer` that will execute
+        `poll` every `Config.POLL_TIME`, until it is cancelled.
     """
     global timer
-    timer = threading.Timer(interval=Config.POLL_TIME,
-                            function=poll,
-                            kwargs=dict(request=request,
-                                        username=username,
-                                        **kwargs))
+    timer = RepeatTimer(interval=Config.POLL_TIME,
+                        function=poll,
+                        kwargs=dict(request=request,
+                                    username=username,
+                                    **kwargs))
     timer.start()
 
 
+def authenticate(request: Callable = None,
+                 opcode: Opcode = None,
+                 success_message: str = None,
+                 read: Callable = input) -> Optional[str]:
+    """Log in to or create an account (depending on `opcode`), giving back
+        its username if successful.
+    """
+    username = read('> Username: ')
+    response = request(opcode=opcode, username=username)
+    error = response.get_error()
+    if error == '':
+        print(f'\n{success_message!s}\n')
+        return username
+    else:
+        print(f'\n{error!s}\n')
+        return None
+
+
+def list_accounts(request: Callable = None,
+                  username: str = None,
+                  read: Callable = input) -> bool:
+    """List the accounts matching a wildcard.
+    """
+    text_wildcard = read('> Text Wildcard: ')
+    response = request(opcode=Opcode.LIST_ACCOUNTS,
+                       text_wildcard=text_wildcard)
+    error = response.get_error()
+    if error == '':
+        accounts = response.get_accounts()
+        print('\nAccounts:\n' +
+              ''.join(f'{account.get_username()} (active: '
+                      f'{account.get_logged_in()})\n'
+                      for account in accounts))
+    else:
+        print(f'\n{error!s}\n')
+    return False
+
+
+def send_message(request: Callable = None,
+                 username: str = None,
+                 read: Callable = input) -> bool:
+    """Send a message from `username` to another account.
+    """
+    recipient = read('> Recipient: ')
+    message = read('> Message: ')
+    response = request(opcode=Opcode.SEND_MESSAGE,
+                       message=message,
+                       recipient_username=recipient,
+                       sender_username=username)
+    error = response.get_error()
+    if error == '':
+        print('\nYour message was sent!\n')
+    else:
+        print(f'\n{error!s}\n')
+    return False
+
+
+def deliver_undelivered_messages(request: Callable = None,
+                                 username: str = None,
+                                 **kwargs) -> bool:
+    """Deliver (and acknowledge) the undelivered messages of `username`.
+    """
+    response = request(opcode=Opcode.DELIVER_UNDELIVERED_MESSAGES,
+                       logged_in=False,
+                       username=username)
+    error = response.get_error()
+    if error == '':
+        messages = response.get_messages()
+
+        # ack the messages
+        _ = request(opcode=Opcode.ACKNOWLEDGE_MESSAGES,
+                    messages=messages)
+
+        print_messages(messages=messages)
+    else:
+        print(f'\n{error!s}\n')
+    return False
+
+
+def delete_account(request: Callable = None,
+                   username: str = None,
+                   **kwargs) -> bool:
+    """Delete the account of `username`, which ends the session.
+    """
+    response = request(opcode=Opcode.DELETE_ACCOUNT,
+                       username=username)
+    error = response.get_error()
+    if error == '':
+        print('\nYour account was deleted!\n')
+        return True
+    else:
+        print(f'\n{error!s}\n')
+        return False
+
+
+def log_out_account(request: Callable = None,
+                    username: str = None,
+                    **kwargs) -> bool:
+    """Log out of the account of `username`, which ends the session.
+    """
+    response = request(opcode=Opcode.LOG_OUT_ACCOUNT,
+                       username=username)
+    error = response.get_error()
+    if error == '':
+        print('\n""""""""""""""""""""'
+              '\nGOODBYE FROM CHATMAN'
+              '\n""""""""""""""""""""\n')
+        return True
+    else:
+        print(f'\n{error!s}\n')
+        return False
+
+
+# the handlers of the options in `_LOGIN_PROMPT`, which give back the
+# username if logging in was successful (otherwise `None`).
+_LOGIN_HANDLERS = {'1': functools.partial(
+                       authenticate,
+                       opcode=Opcode.LOG_IN_ACCOUNT,
+                       success_message='Login succesful!'),
+                   '2': functools.partial(
+                       authenticate,
+                       opcode=Opcode.CREATE_ACCOUNT,
+                       success_message='Account creation succesful!')}
+
+# the handlers of the options in `_MENU_PROMPT`, which give back whether the
+# session is over. like the `_LOGIN_HANDLERS`, they take the `request` and
+# the `read` (i.e. `input`) to use.
+_MENU_HANDLERS = {'1': list_accounts,
+                  '2': send_message,
+                  '3': deliver_undelivered_messages,
+                  '4': delete_account,
+                  '5': log_out_account}
+
+
 def main(entry: Callable, request: Callable, handler: Callable, **kwargs):
     """A nice (TM) generic way of handling the event logic shared by the wire
        and gRPC protocols.
@@ -88,131 +249,52 @@ def main(entry: Callable, request: Callable, handler: Callable, **kwargs):
         onwards to `request` and `handler`.
        `request` does requests across the connection,
        `handler` handles errors.
+       Input is read by `input` if `sys.stdin` is a TTY, otherwise by
+        `read_piped`; either way the session ends at the end of input.
     """
+    read = input if sys.stdin.isatty() else read_piped
+
     try:
         kwargs = entry(**kwargs)
-        has_logged_in = False
+        username = None
+
+        # bind whatever `entry` gave back to `request` once, rather than
+        # spreading `kwargs` into every request (and every handler).
+        request = functools.partial(request, **kwargs)
+
+        # bind what the loops use on every iteration locally, so they're
+        # fast (local) lookups instead of global / attribute ones.
+        _print = print
+        _login_handler = _LOGIN_HANDLERS.get
+        _menu_handler = _MENU_HANDLERS.get
 
-        print('\n""""""""""""""""""\nWELCOME TO CHATMAN\n""""""""""""""""""\n')
+        _print('\n""""""""""""""""""'
+               '\nWELCOME TO CHATMAN'
+               '\n""""""""""""""""""\n')
 
-        while not has_logged_in:
-            print('Do you want to...\n'
-                  '1) Log In\n'
-                  '2) Sign Up\n')
-            opcode = input('> 1/2: ')
+        while username is None:
+            _print(_LOGIN_PROMPT)
+            log_in = _login_handler(read('> 1/2: '), None)
 
-            if opcode not in [str(i + 1) for i in range(2)]:
-                print()
+            if log_in is None:
+                _print()
                 continue
 
-            # - 1 since Opcode.CREATE_ACCOUNT has value 0.
-            opcode = Opcode(int(opcode) - 1)
-            match opcode:
-                case Opcode.LOG_IN_ACCOUNT:
-                    username = input('> Username: ')
-                    response = request(opcode=Opcode.LOG_IN_ACCOUNT,
-                                       username=username,
-                                       **kwargs)
-                    if response.get_error() == '':
-                        print('\nLogin succesful!\n')
-                        has_logged_in = True
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
-                case Opcode.CREATE_ACCOUNT:
-                    username = input('> Username: ')
-                    response = request(opcode=Opcode.CREATE_ACCOUNT,
-                                       username=username,
-                                       **kwargs)
-                    if response.get_error() == '':
-                        print('\nAccount creation succesful!\n')
-                        has_logged_in = True
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
+            username = log_in(request=request, read=read)
 
         # start polling for new messages, every
-        create_poll(request=request, username=username, **kwargs)
-
-        while True:
-            print('Do you want to...\n'
-                  '1) List Accounts\n'
-                  '2) Send a Message\n'
-                  '3) Deliver Undelivered Messages\n'
-                  '4) Delete Account\n'
-                  '5) Log Out\n')
-            opcode = input('> 1/2/3/4/5: ')
-
-            if opcode not in [str(i + 1) for i in range(5)]:
-                print()
+        create_poll(request=request, username=username)
+
+        is_done = False
+        while not is_done:
+            _print(_MENU_PROMPT)
+            menu = _menu_handler(read('> 1/2/3/4/5: '), None)
+
+            if menu is None:
+                _print()
                 continue
 
-            # + 1 since Opcode.[option above] is one more than printed option
-            opcode = Opcode(int(opcode) + 1)
-            match opcode:
-                case Opcode.LIST_ACCOUNTS:
-                    text_wildcard = input('> Text Wildcard: ')
-                    response = request(opcode=Opcode.LIST_ACCOUNTS,
-                                       text_wildcard=text_wildcard,
-                                       **kwargs)
-                    accounts = response.get_accounts()
-                    formatted_accounts = [f'{account.get_username()} (active: '
-                                          f'{account.get_logged_in()})\n'
-                                          for account in accounts]
-                    formatted_account_list = ''.join(formatted_accounts)
-                    if response.get_error() == '':
-                        print(f'\nAccounts:\n{formatted_account_list!s}')
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
-                case Opcode.SEND_MESSAGE:
-                    recipient = input('> Recipient: ')
-                    message = input('> Message: ')
-                    response = request(
-                        opcode=Opcode.SEND_MESSAGE,
-                        message=message,
-                        recipient_username=recipient,
-                        sender_username=username,
-                        **kwargs)
-                    if response.get_error() == '':
-                        print('\nYour message was sent!\n')
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
-                case Opcode.DELIVER_UNDELIVERED_MESSAGES:
-                    response = request(opcode=Opcode
-                                       .DELIVER_UNDELIVERED_MESSAGES,
-                                       logged_in=False,
-                                       username=username,
-                                       **kwargs)
-                    if response.get_error() == '':
-                        messages = response.get_messages()
-
-                        # ack the messages
-                        _ = request(opcode=Opcode
-                                    .ACKNOWLEDGE_MESSAGES,
-                                    messages=messages,
-                                    **kwargs)
-
-                        print_messages(messages=messages)
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
-                case Opcode.LOG_OUT_ACCOUNT:
-                    response = request(opcode=Opcode.LOG_OUT_ACCOUNT,
-                                       username=username,
-                                       **kwargs)
-                    if response.get_error() == '':
-                        print('\n""""""""""""""""""""'
-                              '\nGOODBYE FROM CHATMAN'
-                              '\n""""""""""""""""""""\n')
-                        break
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
-                case Opcode.DELETE_ACCOUNT:
-                    response = request(opcode=Opcode.DELETE_ACCOUNT,
-                                       username=username,
-                                       **kwargs)
-                    if response.get_error() == '':
-                        print('\nYour account was deleted!\n')
-                        break
-                    else:
-                        print(f'\n{response.get_error()!s}\n')
+            is_done = menu(request=request, username=username, read=read)
 
     except Exception as err:
         handler(err=err, **kwargs)
@@ -1,16 +1,22 @@
 # events.py
 # in chat.common.client.shiny
 
+from chat.common.client.events import RepeatTimer
 from chat.common.config import Config
 from chat.common.operations import Opcode
+from collections import defaultdict
 from typing import Callable
 
 import datetime
-import threading
 
 import curses
 
 
+# the valid options of the login and menu prompts in `main`.
+_LOGIN_OPTIONS = frozenset({'1', '2'})
+
+_MENU_OPTIONS = frozenset({'1', '2', '3', '4', '5'})
+
 timer = None
 
 
@@ -141,30 +147,20 @@ def print_messages(messages=None,
                    **kwargs):
     """Prints some `Message`s to the console.
     """
-    formatted_messages = ""
-
     # Create a dictionary to group messages by sender
-    grouped_messages = {}
+    grouped_messages = defaultdict(list)
     for message in messages:
-        sender = message.get_sender_username()
-        if sender in grouped_messages:
-            grouped_messages[sender].append((message.get_time(),
-                                             message.get_message()))
-        else:
-            grouped_messages[sender] = [(message.get_time(),
-                                         message.get_message())]
-
-    # Iterate over the grouped messages and format them
-    for sender, messages in grouped_messages.items():
-        messages.sort(key=lambda t_msg: t_msg[0])
-        formatted_messages += f'\n> {sender}\n'
-        for t, message in messages:
-            formatted_messages += (datetime.datetime.fromtimestamp(t)
-                                   .isoformat(sep=' '))
-            formatted_messages += f' {message}\n'
-
-    # Remove the trailing newline character
-    formatted_messages = formatted_messages.lstrip()
+        grouped_messages[message.get_sender_username()].append(
+            (message.get_time(), message.get_message()))
+
+    # Format the grouped messages, with each sender's sorted by time
+    formatted_messages = ''.join(
+        f'\n> {sender!s}\n' +
+        ''.join(f'{datetime.datetime.fromtimestamp(t).isoformat(sep=" ")}'
+                f' {message!s}\n'
+                for t, message in sorted(sender_messages,
+                                         key=lambda t_msg: t_msg[0]))
+        for sender, sender_messages in grouped_messages.items()).lstrip()
 
     term_y, term_x = term_win.getyx()
     if voicemail:
@@ -197,19 +193,17 @@ def poll(request: Callable = None, username: str = None, **kwargs):
 
         print_messages(messages=messages, **kwargs)
 
-    create_poll(request=request, username=username, **kwargs)
-
 
 def create_poll(request: Callable = None, username: str = None, **kwargs):
-    """Creates the background polling `threading.Timer` that will execute
-        `poll`.
+    """Creates the background polling `RepeatTimer` that will execute
+        `poll` every `Config.POLL_TIME`, until it is cancelled.
     """
     global timer
-    timer = threading.Timer(interval=Config.POLL_TIME,
-                            function=poll,
-                            kwargs=dict(request=request,
-                                        username=username,
-                                        **kwargs))
+    timer = RepeatTimer(interval=Config.POLL_TIME,
+                        function=poll,
+                        kwargs=dict(request=request,
+                                    username=username,
+                                    **kwargs))
     timer.start()
 
 
@@ -241,7 +235,7 @@ def main(entry: Callable, request: Callable, handler: Callable, **kwargs):
             term_win.addstr('> ')
             opcode = term_win.getstr().decode()
 
-            if opcode not in [str(i + 1) for i in range(2)]:
+            if opcode not in _LOGIN_OPTIONS:
                 print_to_term_out("Invalid input.",
                                   "red",
                                   **kwargs)
@@ -299,7 +293,7 @@ def main(entry: Callable, request: Callable, handler: Callable, **kwargs):
             term_win.addstr('> ')
             opcode = term_win.getstr().decode()
 
-            if opcode not in [str(i + 1) for i in range(5)]:
+            if opcode not in _MENU_OPTIONS:
                 print_to_term_out("Invalid input.",
                                   "red",
                                   **kwargs)
@@ -30,6 +30,7 @@ class BaseRequest(Model.model_with_fields(opcode=int)):
         at the `opcode` fields (so we can figure out which deserializers
         to actually use).
     """
+    __slots__ = ()
 
     @staticmethod
     def deserialize_opcode(data: bytes) -> int:
@@ -65,20 +66,19 @@ class BaseRequest(Model.model_with_fields(opcode=int)):
 
         class __impl_class__(
             BaseRequest.add_fields(
-                field_defaults=dict(list(field_defaults.items()) +
-                                    list(dict(opcode=opcode.value).items())),
-                field_deserializers=dict(list(field_deserializers.items()) +
-                                         [('opcode',
-                                           BaseRequest.deserialize_opcode)]),
-                field_serializers=dict(list(field_serializers.items()) +
-                                       [('opcode',
-                                         BaseRequest.serialize_opcode)]),
+                field_defaults={**field_defaults, 'opcode': opcode.value},
+                field_deserializers={
+                    **field_deserializers,
+                    'opcode': BaseRequest.deserialize_opcode},
+                field_serializers={
+                    **field_serializers,
+                    'opcode': BaseRequest.serialize_opcode},
                 order_of_fields=(order_of_fields or
                                  (['opcode'] +
                                   list(new_fields.keys()))),
                 fields_list_nested=fields_list_nested,
                 **new_fields)):
-            pass
+            __slots__ = ()
 
         return __impl_class__
 
@@ -86,6 +86,7 @@ class BaseRequest(Model.model_with_fields(opcode=int)):
 class BaseResponse(BaseRequest.add_fields(error=str)):
     """A `Model` which has an `error` field.
     """
+    __slots__ = ()
 
     @staticmethod
     def add_fields_with_opcode(opcode: int,
@@ -100,20 +101,19 @@ class BaseResponse(BaseRequest.add_fields(error=str)):
 
         class __impl_class__(
             BaseResponse.add_fields(
-                field_defaults=dict(list(field_defaults.items()) +
-                                    list(dict(opcode=opcode.value).items())),
-                field_deserializers=dict(list(field_deserializers.items()) +
-                                         [('opcode',
-                                           BaseRequest.deserialize_opcode)]),
-                field_serializers=dict(list(field_serializers.items()) +
-                                       [('opcode',
-                                         BaseRequest.serialize_opcode)]),
+                field_defaults={**field_defaults, 'opcode': opcode.value},
+                field_deserializers={
+                    **field_deserializers,
+                    'opcode': BaseRequest.deserialize_opcode},
+                field_serializers={
+                    **field_serializers,
+                    'opcode': BaseRequest.serialize_opcode},
                 order_of_fields=(order_of_fields or
                                  (['opcode'] +
                                   list(new_fields.keys()))),
                 fields_list_nested=fields_list_nested,
                 **new_fields)):
-            pass
+            __slots__ = ()
 
         return __impl_class__
 
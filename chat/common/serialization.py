@@ -61,7 +61,7 @@ class SerializationUtils:
         """
         length = SerializationUtils.deserialize_int(data[:STR_LEN_BITS],
                                                     length=STR_LEN_BITS)
-        return data[STR_LEN_BITS:length + STR_LEN_BITS].decode('utf-8')
+        return str(data[STR_LEN_BITS:length + STR_LEN_BITS], 'utf-8')
 
     @staticmethod
     def serialize_str(val: str) -> bytes:
@@ -78,30 +78,28 @@ class SerializationUtils:
     def deserialize_list(data: bytes,
                          item_deserialize: Callable,
                          item_serialize: Callable,
-                         remain: Optional[int] = None) -> bytes:
+                         remain: Optional[int] = None) -> list:
         """Deserialize `bytes` into a `list` using some explicit item
             (de)serialization. First few `bytes` are the length of the `list`,
             then we use `item_deserialize` to get each item, figure out how
             far to seek ahead using `len(item_serialize(...))` on the
             deserialized object.
+            If `remain` is given, there's no length prefix and that many
+            items are deserialized.
         """
+        # a `memoryview` so seeking ahead doesn't copy the rest of `data`.
+        data = memoryview(data)
         if remain is None:
-            length = SerializationUtils.deserialize_int(data[:LIST_LEN_BITS],
+            remain = SerializationUtils.deserialize_int(data[:LIST_LEN_BITS],
                                                         length=LIST_LEN_BITS)
-            return SerializationUtils.deserialize_list(data[LIST_LEN_BITS:],
-                                                       item_deserialize,
-                                                       item_serialize,
-                                                       remain=length)
-        elif remain == 0:
-            return []
-        else:
+            data = data[LIST_LEN_BITS:]
+
+        items = []
+        for _ in range(remain):
             obj = item_deserialize(data)
-            length = len(item_serialize(obj))
-            return [obj] + SerializationUtils.deserialize_list(
-                data[length:],
-                item_deserialize,
-                item_serialize,
-                remain=remain - 1)
+            data = data[len(item_serialize(obj)):]
+            items.append(obj)
+        return items
 
     @staticmethod
     def serialize_list(val: list,
@@ -110,20 +108,15 @@ class SerializationUtils:
         """Serialize `list` into `bytes` using some explicit item
             serialization. First few `bytes` are the length of the `list`,
             then we use `item_serialize` for each item and concat the results.
+            If `remain` is given, there's no length prefix and only the first
+            `remain` items are serialized.
         """
         if val is None:
             val = []
-        if remain is None:
-            val = val[:Config.LIST_MAX_LEN]
-            return (SerializationUtils.serialize_int(len(val),
-                                                     length=LIST_LEN_BITS) +
-                    SerializationUtils.serialize_list(val,
-                                                      item_serialize,
-                                                      remain=len(val)))
-        elif remain == 0:
-            return b''
-        else:
-            return (item_serialize(val[0]) +
-                    SerializationUtils.serialize_list(val[1:],
-                                                      item_serialize,
-                                                      remain=remain - 1))
+        if remain is not None:
+            return b''.join(map(item_serialize, val[:remain]))
+
+        val = val[:Config.LIST_MAX_LEN]
+        return (SerializationUtils.serialize_int(len(val),
+                                                 length=LIST_LEN_BITS) +
+                b''.join(map(item_serialize, val)))
@@ -2,10 +2,17 @@
 # in chat.common
 
 import builtins
+import functools
+import sys
 
 from chat.common.serialization import SerializationUtils
-from enum import Enum, EnumMeta
-from typing import Callable, Dict, List, Optional, Type
+from enum import EnumMeta
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+
+# the types of defaults that `Model.model_with_fields` caches on, i.e. those
+# whose values are interchangeable when they are equal and of the same type.
+_CACHEABLE_DEFAULT_TYPES = frozenset({type(None), bool, int, str, bytes})
 
 
 class Interface(object):
@@ -16,6 +23,8 @@ class Interface(object):
           `_fields_enum`: An `Enum` subclass which has members of the names
                           of the field name and values of the field type.
     """
+    __slots__ = ()
+
     _fields_enum: Optional[type] = None
 
 
@@ -24,9 +33,15 @@ class Model(object):
        Useful for making new models, or (de)serializing.
     """
 
+    # the fields themselves are the `__slots__` of the generated subclasses.
+    __slots__ = ()
+
     # the fields and their types
     _fields: Dict[str, type] = {}
 
+    # the fields and their (interned) private names, i.e. their `__slots__`
+    _private_fields: Dict[str, str] = {}
+
     # the fields and their defaults (not necessary)
     _field_defaults: Dict[str, object] = {}
 
@@ -48,26 +63,25 @@ class Model(object):
     # be at a minimum useful for awkard class attributes sharing object
     # attributes names, so best to just discourage it entirely.
     _reserved_fields = ['fields',
-                        'field_defaults'
+                        'field_defaults',
                         'field_deserializers',
                         'field_serializers',
                         'order_of_fields',
                         'fields_list_nested',
+                        'private_fields',
                         'reserved_fields']
 
     def __eq__(self, other) -> bool:
         """Test for equality on every field's `__eq__`
         """
-        return len([n for n in self._fields
-                    if getattr(self, f'get_{n!s}', lambda: None)() !=
-                    getattr(other, f'get_{n!s}', lambda: None)()]) == 0
+        return all(getattr(self, p) == getattr(other, p, None)
+                   for p in self._private_fields.values())
 
     def __str__(self) -> str:
         """Concatenates every field's `__str__`
         """
-        return ','.join([f'{n!s}: '
-                         f'{getattr(self, f"get_{n!s}", lambda: None)()!s}'
-                         for n in self._fields])
+        return ','.join([f'{n!s}: {getattr(self, p)!s}'
+                         for n, p in self._private_fields.items()])
 
     @staticmethod
     def default_deserializer(t: Type) -> Optional[Callable]:
@@ -112,58 +126,22 @@ class Model(object):
         """The default list deserializer if we can deduce the items'
             default deserializers (via `default_deserializer`).
         """
+        item_deserialize = Model.default_deserializer(t)
+        item_serialize = Model.default_serializer(t)
         return (lambda d: SerializationUtils.deserialize_list(
                     d,
-                    Model.default_deserializer(t),
-                    Model.default_serializer(t)))
+                    item_deserialize,
+                    item_serialize))
 
     @staticmethod
     def default_list_serializer(t: Type) -> Callable:
         """The default list serializer if we can deduce the items'
             default serializers (via `default_serializer`).
         """
+        item_serialize = Model.default_serializer(t)
         return (lambda v: SerializationUtils.serialize_list(
                     v,
-                    Model.default_serializer(t)))
-
-    @classmethod
-    def deserialize(cls, data: bytes):
-        """Deserialize a `Model` according to its `order_of_fields` and
-            `field_deserializers`.
-
-            Can cause some headaches on optional arguments, so assume there
-            are no `None` values.
-        """
-        # TODO: this can get screw-y with optionals.
-        # a janky way of doing it without more code would be just doing it
-        # on lists (of max len 1).
-        obj = cls()
-        for name in cls._order_of_fields:
-            deserializer = cls._field_deserializers[name]
-            serializer = cls._field_serializers[name]
-
-            field_val = deserializer(data)
-            length = len(serializer(field_val))
-
-            getattr(obj, f'set_{name!s}', lambda _: obj)(field_val)
-            try:
-                data = data[length:]
-            except Exception:
-                break
-        return obj
-
-    def serialize(self) -> bytes:
-        """Serialize a `Model` according to its `order_of_fields` and
-            `field_serializers`.
-
-            Can cause some headaches on optional arguments, so assume there
-            are no `None` values.
-        """
-        return b''.join(self._field_serializers[name](getattr(self,
-                                                              f'get_{name!s}',
-                                                              lambda:
-                                                              None)())
-                        for name in self._order_of_fields)
+                    item_serialize))
 
     @classmethod
     def from_grpc_model(model, grpc_obj):
@@ -179,7 +157,7 @@ class Model(object):
                     val = [nested_model.from_grpc_model(v)
                            for v in val or []]
 
-            getattr(obj, f'set_{name!s}', lambda _: obj)(val)
+            setattr(obj, model._private_fields[name], val)
         return obj
 
     def as_model(self, model: Type):
@@ -187,9 +165,9 @@ class Model(object):
             fields we share. Nothing fancy.
         """
         obj = model()
-        for name in self._fields:
-            getattr(obj, f'set_{name!s}', lambda _: obj)(
-                getattr(self, f'get_{name!s}', lambda: None)())
+        for name, private_name in self._private_fields.items():
+            if name in model._private_fields:
+                setattr(obj, private_name, getattr(self, private_name))
         return obj
 
     @staticmethod
@@ -200,14 +178,70 @@ class Model(object):
                           fields_list_nested: Dict[str, type] = {},
                           **fields: Dict[str, type]) -> type:
         """Create a new `Model` subclass with the given class attributes.
+
+            The same arguments give back the same (cached) class, so two
+            models declared with identical fields are one and the same class
+            (and `is` / `type` can't tell them apart); subclass it if a
+            distinct class is needed. This is only cached if every default
+            is a `None`, `bool`, `int`, `str` or `bytes`, and those are keyed
+            on along with their type (so e.g. `1` and `True` don't collide).
         """
+        args = (tuple((name, type(value), value)
+                      for name, value in field_defaults.items()),
+                tuple(field_deserializers.items()),
+                tuple(field_serializers.items()),
+                tuple(order_of_fields) if order_of_fields else None,
+                tuple(fields_list_nested.items()),
+                tuple(fields.items()))
 
-        for name in fields:
+        try:
+            hash(args)
+        except TypeError:
+            # e.g. an unhashable (de)serializer, so just don't cache it.
+            return Model._build_model.__wrapped__(*args)
+
+        if any(t not in _CACHEABLE_DEFAULT_TYPES for _, t, _ in args[0]):
+            return Model._build_model.__wrapped__(*args)
+
+        return Model._build_model(*args)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_model(field_defaults: Tuple[Tuple[str, type, object], ...],
+                     field_deserializers: Tuple[Tuple[str, Callable], ...],
+                     field_serializers: Tuple[Tuple[str, Callable], ...],
+                     order_of_fields: Optional[Tuple[str, ...]],
+                     fields_list_nested: Tuple[Tuple[str, type], ...],
+                     fields: Tuple[Tuple[str, type], ...]) -> type:
+        """The implementation of `model_with_fields`, with every argument
+            as a `tuple` (of `dict` items, and the defaults with their type)
+            so that it can be cached.
+        """
+        field_defaults = {name: value for name, _, value in field_defaults}
+        field_deserializers = dict(field_deserializers)
+        field_serializers = dict(field_serializers)
+        fields_list_nested = dict(fields_list_nested)
+        fields = dict(fields)
+
+        for name, value in fields.items():
             if name in Model._reserved_fields:
                 raise ValueError(f'Field \'{name!s}\' is a reserved name.')
+            if not name.isidentifier():
+                raise ValueError(f'Field \'{name!s}\' is not an identifier.')
+            if type(value) is not type:
+                raise ValueError(f'Field \'{name!s}\' with value '
+                                 f'\'{value!r}\' which is not a `type`.')
 
-        # this gives the explicit order, or just uses the keys.
-        order = order_of_fields or list(fields.keys())
+        # this gives the explicit order, or just uses the keys, and any
+        # fields missing from the explicit order go at the end.
+        order = list(order_of_fields or fields.keys())
+        ordered = set(order)
+        order += [name for name in fields if name not in ordered]
+
+        for name in ordered:
+            if name not in fields:
+                raise ValueError(f'Field \'{name!s}\' is in the order of '
+                                 f'fields, but is not a field.')
 
         # set default (de)serializers, if not set
         for name, t in fields.items():
@@ -236,92 +270,85 @@ class Model(object):
             field_deserializers[name] = deserialize
             field_serializers[name] = serialize
 
-        class __impl_model__(Model):
-            # copy is likely safest here...
-            _fields = {k: v for k, v in fields.items()}
-
-            _field_defaults = {k: v for k, v in field_defaults.items()}
-
-            _field_deserializers = {k: v
-                                    for k, v in field_deserializers.items()}
-
-            _field_serializers = {k: v for k, v in field_serializers.items()}
-
-            _order_of_fields = order
-
-            _fields_list_nested = {k: v for k, v in fields_list_nested.items()}
-
-        return __impl_model__.add_getters_setters()
-
-    @classmethod
-    def add_getters_setters(model):
-        """Add getters and setters for each field in the model.
-        """
-        for name, value in model._fields.items():
-
-            if type(value) is not type:
-                raise ValueError(f'Field \'{name!s}\' with value '
-                                 f'\'{value!r}\' which is not a `type`.')
-
-            # note: you do NOT want to put `private_name` within any of the
-            #       implementations that will be `setattr`ed, since then
-            #       `private_name` the variable will be bound to the function.
-            #       Another way would be to explicitly `del` it, but uh, that's
-            #       not very pythonic...
-            #
-            #       For some stupid, hacky reason the default works.
-            #       I guess since it puts it in the function's `__defaults__`
-            #       attribute...
-            private_name = f'_{name!s}'
-
-            # the getter we'll add to `model`.
-            def __impl_setter__(self: model,
-                                val: Optional[value],
-                                private_name: str = private_name):
-                setattr(self, private_name, val)
-                return self
-
-            setattr(model, f'set_{name!s}', __impl_setter__)
-
-            # the setter we'll add to `model`.
-            def __impl_getter__(self: model,
-                                private_name: str = private_name):
-                return getattr(self, private_name, None)
-
-            setattr(model, f'get_{name!s}', __impl_getter__)
-
-        # the `__init__` we'll add to `model`.
-        # this might get weird with inheritence, but as long as the inherited
-        # call `add_getters_setters`, then we should be good.
-        def __impl_init__(self, **kwargs) -> model:
-            for name in self._fields:
-                if name in kwargs:
-                    getattr(self, f'set_{name!s}', lambda _: _)(kwargs
-                                                                [name])
-                else:
-                    setattr(self,
-                            f'_{name!s}',
-                            self._field_defaults.get(name, None))
-
-        setattr(model, '__init__', __impl_init__)
-
-        return model.clean_getters_setters()
+        # the private name (i.e. slot) of each field, `_` + its name.
+        # names starting with `__` are name-mangled within the class body
+        # below, so for fields starting with `_` we write the mangled name
+        # out ourselves; that way the generated source and the string
+        # lookups (through `_private_fields`) agree on it.
+        private_fields = {name: sys.intern(f'_impl_model___{name!s}'
+                                           if name.startswith('_') and
+                                           not name.endswith('__') else
+                                           f'_{name!s}')
+                          for name in fields}
+
+        # the generated source of the `Model` subclass. It's done this way
+        # (as in e.g. `dataclasses`) so every field gets a real slot, and the
+        # getters / setters / `__init__` are plain functions, rather than
+        # closures doing `getattr` / `setattr` with a private name.
+        src = ['class __impl_model__(Model):',
+               f'    __slots__ = {tuple(private_fields.values())!r}',
+               '',
+               '    def __init__(self, **kwargs):']
+        src += [f'        self.{private_fields[name]!s} = '
+                f'kwargs.get({name!r}, _default_{name!s})'
+                for name in fields] or ['        pass']
+        for name in fields:
+            src += ['',
+                    f'    def get_{name!s}(self):',
+                    f'        return self.{private_fields[name]!s}',
+                    '',
+                    f'    def set_{name!s}(self, val):',
+                    f'        self.{private_fields[name]!s} = val',
+                    '        return self']
+
+        # (de)serialize straight through `order`, rather than looking up
+        # each field's (de)serializer and getter / setter on every call (so
+        # these are the only `serialize` / `deserialize`, `Model` itself has
+        # no generic ones). this can cause some headaches on optional
+        # arguments, so assume there are no `None` values.
+        # TODO: this can get screw-y with optionals.
+        # a janky way of doing it without more code would be just doing it
+        # on lists (of max len 1).
+        src += ['',
+                '    @classmethod',
+                '    def deserialize(cls, data):',
+                '        obj = cls()']
+        for idx, name in enumerate(order):
+            src += [f'        obj.{private_fields[name]!s} = val = '
+                    f'_deserialize_{name!s}(data)']
+            if idx < len(order) - 1:
+                src += [f'        data = data[len(_serialize_{name!s}(val)):]']
+        src += ['        return obj',
+                '',
+                '    def serialize(self):',
+                '        return b\'\'.join((' +
+                ''.join(f'_serialize_{name!s}'
+                        f'(self.{private_fields[name]!s}), '
+                        for name in order) +
+                '))']
+
+        namespace = {f'_default_{name!s}': field_defaults.get(name, None)
+                     for name in fields}
+        namespace.update({f'_deserialize_{name!s}': field_deserializers[name]
+                          for name in fields})
+        namespace.update({f'_serialize_{name!s}': field_serializers[name]
+                          for name in fields})
+        namespace['Model'] = Model
+        namespace['__name__'] = __name__
+        exec('\n'.join(src), namespace)
+        model = namespace['__impl_model__']
+
+        # copy is likely safest here...
+        model._fields = {k: v for k, v in fields.items()}
+        model._private_fields = private_fields
+        model._field_defaults = {k: v for k, v in field_defaults.items()}
+        model._field_deserializers = {k: v
+                                      for k, v in field_deserializers.items()}
+        model._field_serializers = {k: v for k, v in field_serializers.items()}
+        model._order_of_fields = order
+        model._fields_list_nested = {k: v
+                                     for k, v in fields_list_nested.items()}
 
-    @classmethod
-    def clean_getters_setters(model):
-        """Remove getters and setters for each field not in the model.
-        """
-        for attr_name in dir(model):
-            match attr_name[:4]:
-                case 'get_':
-                    if attr_name[4:] not in model._fields:
-                        setattr(model, attr_name, None)
-                case 'set_':
-                    if attr_name[4:] not in model._fields:
-                        setattr(model, attr_name, None)
-        for name in model._fields:
-            if name not in model._order_of_fields:
-                model._order_of_fields.append(name)
         return model
 
     @classmethod
@@ -336,17 +363,14 @@ class Model(object):
             of whatever `Model` subclass it's called from, adding on.
         """
         return Model.model_with_fields(
-            field_defaults=dict(list(cls._field_defaults.items()) +
-                                list(field_defaults.items())),
-            field_deserializers=dict(list(cls._field_deserializers.items()) +
-                                     list(field_deserializers.items())),
-            field_serializers=dict(list(cls._field_serializers.items()) +
-                                   list(field_serializers.items())),
-            fields_list_nested=dict(list(cls._fields_list_nested.items()) +
-                                    list(fields_list_nested.items())),
+            field_defaults={**cls._field_defaults, **field_defaults},
+            field_deserializers={**cls._field_deserializers,
+                                 **field_deserializers},
+            field_serializers={**cls._field_serializers, **field_serializers},
+            fields_list_nested={**cls._fields_list_nested,
+                                **fields_list_nested},
             order_of_fields=order_of_fields,
-            **dict(list(cls._fields.items()) +
-                   list(new_fields.items()))).add_getters_setters()
+            **{**cls._fields, **new_fields})
 
     @classmethod
     def omit_fields(cls,
@@ -364,19 +388,18 @@ class Model(object):
                 raise ValueError(f'Cannot omit field \'{fname!s}\'; '
                                  f'it is not a field of {cls!s}.')
         return Model.model_with_fields(
-            field_defaults=dict(list(cls._field_defaults.items()) +
-                                list(field_defaults.items())),
-            field_deserializers=dict(list(cls._field_deserializers.items()) +
-                                     list(field_deserializers.items())),
-            field_serializers=dict(list(cls._field_serializers.items()) +
-                                   list(field_serializers.items())),
+            field_defaults={**cls._field_defaults, **field_defaults},
+            field_deserializers={**cls._field_deserializers,
+                                 **field_deserializers},
+            field_serializers={**cls._field_serializers, **field_serializers},
             order_of_fields=order_of_fields,
-            fields_list_nested=dict(list(cls._fields_list_nested.items()) +
-                                    list(fields_list_nested.items())),
+            fields_list_nested={**cls._fields_list_nested,
+                                **fields_list_nested},
             **{n: t for n, t in cls._fields.items()
-               if n not in rm_fields}).add_getters_setters()
+               if n not in rm_fields})
 
 
+@functools.lru_cache(maxsize=None)
 def model_from_proto(iface: type) -> type:
     """Materializes a class with getters and setters from an interface.
 
@@ -385,7 +408,8 @@ def model_from_proto(iface: type) -> type:
                                if `iface._fields_enum`'s members do not have
                                  `str` names and `type` values.
 
-        Returns: A `class` generated by the `iface : interface`.
+        Returns: A `class` generated by the `iface : interface`, which is
+                 cached per `iface`.
     """
     if not issubclass(iface, Interface):
         raise ValueError(f'Arg `iface` ({iface!r}) is not a subclass of '
@@ -395,23 +419,13 @@ def model_from_proto(iface: type) -> type:
         raise ValueError(f'Arg `iface` ({iface!r}) does not have a '
                          f'`_fields_enum` attribute.')
 
-    not_enum = False
-    if (type(iface._fields_enum) is not Enum and
-            type(iface._fields_enum) is not EnumMeta):
-        not_enum = True
-
-    if not not_enum:
-        if (not issubclass(iface._fields_enum, Enum) and
-                not issubclass(iface._fields_enum, EnumMeta)):
-            not_enum = True
-
-    if not_enum:
+    # `EnumMeta` is the metaclass of every `Enum` subclass.
+    if not isinstance(iface._fields_enum, EnumMeta):
         raise ValueError(f'Arg `iface`\'s `_fields_enum` attribute '
                          f'({iface._fields_enum!r}) is not an `Enum` '
                          f'(type is {type(iface._fields_enum)!r}).')
 
     # we may iterate an `Enum`'s members dictionary by `__members__`.
-    return Model.model_from_fields(**dict([(member.name, member.value)
-                                           for _, member in
-                                           iface._fields_enum.__members__
-                                           .items()]))
+    fields = {name: member.value
+              for name, member in iface._fields_enum.__members__.items()}
+    return Model.model_with_fields(**fields)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: chat/grpc/grpcio/proto.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'chat/grpc/grpcio/proto.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1c\x63hat/grpc/grpcio/proto.proto\x12\x04\x63hat\".\n\x07\x41\x63\x63ount\x12\x11\n\tlogged_in\x18\x01 \x01(\x08\x12\x10\n\x08username\x18\x02 \x01(\t\"\x8d\x01\n\x07Message\x12\x11\n\tdelivered\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x1b\n\x13recipient_logged_in\x18\x03 \x01(\x08\x12\x1a\n\x12recipient_username\x18\x04 \x01(\t\x12\x17\n\x0fsender_username\x18\x05 \x01(\t\x12\x0c\n\x04time\x18\x06 \x01(\x03\"\'\n\x13LogInAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"%\n\x14LogInAccountResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"(\n\x14\x43reateAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"&\n\x15\x43reateAccountResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\",\n\x13ListAccountsRequest\x12\x15\n\rtext_wildcard\x18\x01 \x01(\t\"F\n\x14ListAccountsResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\x12\x1f\n\x08\x61\x63\x63ounts\x18\x02 \x03(\x0b\x32\r.chat.Account\"Z\n\x12SendMessageRequest\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x1a\n\x12recipient_username\x18\x02 \x01(\t\x12\x17\n\x0fsender_username\x18\x03 \x01(\t\"$\n\x13SendMessageResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"H\n!DeliverUndeliveredMessagesRequest\x12\x11\n\tlogged_in\x18\x01 \x01(\x08\x12\x10\n\x08username\x18\x02 \x01(\t\"T\n\"DeliverUndeliveredMessagesResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\x12\x1f\n\x08messages\x18\x02 \x03(\x0b\x32\r.chat.Message\"=\n\x1a\x41\x63knowledgeMessagesRequest\x12\x1f\n\x08messages\x18\x01 \x03(\x0b\x32\r.chat.Message\",\n\x1b\x41\x63knowledgeMessagesResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"(\n\x14LogOutAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"&\n\x15LogOutAccountResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t\"(\n\x14\x44\x65leteAccountRequest\x12\x10\n\x08username\x18\x01 \x01(\t\"&\n\x15\x44\x65leteAccountResponse\x12\r\n\x05\x65rror\x18\x01 \x01(\t2\x93\x05\n\x04\x43hat\x12G\n\x0cLogInAccount\x12\x19.chat.LogInAccountRequest\x1a\x1a.chat.LogInAccountResponse\"\x00\x12J\n\rCreateAccount\x12\x1a.chat.CreateAccountRequest\x1a\x1b.chat.CreateAccountResponse\"\x00\x12G\n\x0cListAccounts\x12\x19.chat.ListAccountsRequest\x1a\x1a.chat.ListAccountsResponse\"\x00\x12\x44\n\x0bSendMessage\x12\x18.chat.SendMessageRequest\x1a\x19.chat.SendMessageResponse\"\x00\x12q\n\x1a\x44\x65liverUndeliveredMessages\x12\'.chat.DeliverUndeliveredMessagesRequest\x1a(.chat.DeliverUndeliveredMessagesResponse\"\x00\x12J\n\rDeleteAccount\x12\x1a.chat.DeleteAccountRequest\x1a\x1b.chat.DeleteAccountResponse\"\x00\x12J\n\rLogOutAccount\x12\x1a.chat.LogOutAccountRequest\x1a\x1b.chat.LogOutAccountResponse\"\x00\x12\\\n\x13\x41\x63knowledgeMessages\x12 .chat.AcknowledgeMessagesRequest\x1a!.chat.AcknowledgeMessagesResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'chat.grpc.grpcio.proto_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ACCOUNT']._serialized_start=38
+  _globals['_ACCOUNT']._serialized_end=84
+  _globals['_MESSAGE']._serialized_start=87
+  _globals['_MESSAGE']._serialized_end=228
+  _globals['_LOGINACCOUNTREQUEST']._serialized_start=230
+  _globals['_LOGINACCOUNTREQUEST']._serialized_end=269
+  _globals['_LOGINACCOUNTRESPONSE']._serialized_start=271
+  _globals['_LOGINACCOUNTRESPONSE']._serialized_end=308
+  _globals['_CREATEACCOUNTREQUEST']._serialized_start=310
+  _globals['_CREATEACCOUNTREQUEST']._serialized_end=350
+  _globals['_CREATEACCOUNTRESPONSE']._serialized_start=352
+  _globals['_CREATEACCOUNTRESPONSE']._serialized_end=390
+  _globals['_LISTACCOUNTSREQUEST']._serialized_start=392
+  _globals['_LISTACCOUNTSREQUEST']._serialized_end=436
+  _globals['_LISTACCOUNTSRESPONSE']._serialized_start=438
+  _globals['_LISTACCOUNTSRESPONSE']._serialized_end=508
+  _globals['_SENDMESSAGEREQUEST']._serialized_start=510
+  _globals['_SENDMESSAGEREQUEST']._serialized_end=600
+  _globals['_SENDMESSAGERESPONSE']._serialized_start=602
+  _globals['_SENDMESSAGERESPONSE']._serialized_end=638
+  _globals['_DELIVERUNDELIVEREDMESSAGESREQUEST']._serialized_start=640
+  _globals['_DELIVERUNDELIVEREDMESSAGESREQUEST']._serialized_end=712
+  _globals['_DELIVERUNDELIVEREDMESSAGESRESPONSE']._serialized_start=714
+  _globals['_DELIVERUNDELIVEREDMESSAGESRESPONSE']._serialized_end=798
+  _globals['_ACKNOWLEDGEMESSAGESREQUEST']._serialized_start=800
+  _globals['_ACKNOWLEDGEMESSAGESREQUEST']._serialized_end=861
+  _globals['_ACKNOWLEDGEMESSAGESRESPONSE']._serialized_start=863
+  _globals['_ACKNOWLEDGEMESSAGESRESPONSE']._serialized_end=907
+  _globals['_LOGOUTACCOUNTREQUEST']._serialized_start=909
+  _globals['_LOGOUTACCOUNTREQUEST']._serialized_end=949
+  _globals['_LOGOUTACCOUNTRESPONSE']._serialized_start=951
+  _globals['_LOGOUTACCOUNTRESPONSE']._serialized_end=989
+  _globals['_DELETEACCOUNTREQUEST']._serialized_start=991
+  _globals['_DELETEACCOUNTREQUEST']._serialized_end=1031
+  _globals['_DELETEACCOUNTRESPONSE']._serialized_start=1033
+  _globals['_DELETEACCOUNTRESPONSE']._serialized_end=1071
+  _globals['_CHAT']._serialized_start=1074
+  _globals['_CHAT']._serialized_end=1733
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,137 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Account(_message.Message):
+    __slots__ = ("logged_in", "username")
+    LOGGED_IN_FIELD_NUMBER: _ClassVar[int]
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    logged_in: bool
+    username: str
+    def __init__(self, logged_in: _Optional[bool] = ..., username: _Optional[str] = ...) -> None: ...
+
+class Message(_message.Message):
+    __slots__ = ("delivered", "message", "recipient_logged_in", "recipient_username", "sender_username", "time")
+    DELIVERED_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    RECIPIENT_LOGGED_IN_FIELD_NUMBER: _ClassVar[int]
+    RECIPIENT_USERNAME_FIELD_NUMBER: _ClassVar[int]
+    SENDER_USERNAME_FIELD_NUMBER: _ClassVar[int]
+    TIME_FIELD_NUMBER: _ClassVar[int]
+    delivered: bool
+    message: str
+    recipient_logged_in: bool
+    recipient_username: str
+    sender_username: str
+    time: int
+    def __init__(self, delivered: _Optional[bool] = ..., message: _Optional[str] = ..., recipient_logged_in: _Optional[bool] = ..., recipient_username: _Optional[str] = ..., sender_username: _Optional[str] = ..., time: _Optional[int] = ...) -> None: ...
+
+class LogInAccountRequest(_message.Message):
+    __slots__ = ("username",)
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    def __init__(self, username: _Optional[str] = ...) -> None: ...
+
+class LogInAccountResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
+
+class CreateAccountRequest(_message.Message):
+    __slots__ = ("username",)
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    def __init__(self, username: _Optional[str] = ...) -> None: ...
+
+class CreateAccountResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
+
+class ListAccountsRequest(_message.Message):
+    __slots__ = ("text_wildcard",)
+    TEXT_WILDCARD_FIELD_NUMBER: _ClassVar[int]
+    text_wildcard: str
+    def __init__(self, text_wildcard: _Optional[str] = ...) -> None: ...
+
+class ListAccountsResponse(_message.Message):
+    __slots__ = ("error", "accounts")
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    ACCOUNTS_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    accounts: _containers.RepeatedCompositeFieldContainer[Account]
+    def __init__(self, error: _Optional[str] = ..., accounts: _Optional[_Iterable[_Union[Account, _Mapping]]] = ...) -> None: ...
+
+class SendMessageRequest(_message.Message):
+    __slots__ = ("message", "recipient_username", "sender_username")
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    RECIPIENT_USERNAME_FIELD_NUMBER: _ClassVar[int]
+    SENDER_USERNAME_FIELD_NUMBER: _ClassVar[int]
+    message: str
+    recipient_username: str
+    sender_username: str
+    def __init__(self, message: _Optional[str] = ..., recipient_username: _Optional[str] = ..., sender_username: _Optional[str] = ...) -> None: ...
+
+class SendMessageResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
+
+class DeliverUndeliveredMessagesRequest(_message.Message):
+    __slots__ = ("logged_in", "username")
+    LOGGED_IN_FIELD_NUMBER: _ClassVar[int]
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    logged_in: bool
+    username: str
+    def __init__(self, logged_in: _Optional[bool] = ..., username: _Optional[str] = ...) -> None: ...
+
+class DeliverUndeliveredMessagesResponse(_message.Message):
+    __slots__ = ("error", "messages")
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    messages: _containers.RepeatedCompositeFieldContainer[Message]
+    def __init__(self, error: _Optional[str] = ..., messages: _Optional[_Iterable[_Union[Message, _Mapping]]] = ...) -> None: ...
+
+class AcknowledgeMessagesRequest(_message.Message):
+    __slots__ = ("messages",)
+    MESSAGES_FIELD_NUMBER: _ClassVar[int]
+    messages: _containers.RepeatedCompositeFieldContainer[Message]
+    def __init__(self, messages: _Optional[_Iterable[_Union[Message, _Mapping]]] = ...) -> None: ...
+
+class AcknowledgeMessagesResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
+
+class LogOutAccountRequest(_message.Message):
+    __slots__ = ("username",)
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    def __init__(self, username: _Optional[str] = ...) -> None: ...
+
+class LogOutAccountResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
+
+class DeleteAccountRequest(_message.Message):
+    __slots__ = ("username",)
+    USERNAME_FIELD_NUMBER: _ClassVar[int]
+    username: str
+    def __init__(self, username: _Optional[str] = ...) -> None: ...
+
+class DeleteAccountResponse(_message.Message):
+    __slots__ = ("error",)
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    error: str
+    def __init__(self, error: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,398 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from chat.grpc.grpcio import proto_pb2 as chat_dot_grpc_dot_grpcio_dot_proto__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in chat/grpc/grpcio/proto_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ChatStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.LogInAccount = channel.unary_unary(
+                '/chat.Chat/LogInAccount',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountResponse.FromString,
+                _registered_method=True)
+        self.CreateAccount = channel.unary_unary(
+                '/chat.Chat/CreateAccount',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountResponse.FromString,
+                _registered_method=True)
+        self.ListAccounts = channel.unary_unary(
+                '/chat.Chat/ListAccounts',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsResponse.FromString,
+                _registered_method=True)
+        self.SendMessage = channel.unary_unary(
+                '/chat.Chat/SendMessage',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageResponse.FromString,
+                _registered_method=True)
+        self.DeliverUndeliveredMessages = channel.unary_unary(
+                '/chat.Chat/DeliverUndeliveredMessages',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesResponse.FromString,
+                _registered_method=True)
+        self.DeleteAccount = channel.unary_unary(
+                '/chat.Chat/DeleteAccount',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountResponse.FromString,
+                _registered_method=True)
+        self.LogOutAccount = channel.unary_unary(
+                '/chat.Chat/LogOutAccount',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountResponse.FromString,
+                _registered_method=True)
+        self.AcknowledgeMessages = channel.unary_unary(
+                '/chat.Chat/AcknowledgeMessages',
+                request_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesRequest.SerializeToString,
+                response_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesResponse.FromString,
+                _registered_method=True)
+
+
+class ChatServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def LogInAccount(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateAccount(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListAccounts(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SendMessage(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeliverUndeliveredMessages(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteAccount(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def LogOutAccount(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AcknowledgeMessages(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ChatServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'LogInAccount': grpc.unary_unary_rpc_method_handler(
+                    servicer.LogInAccount,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountResponse.SerializeToString,
+            ),
+            'CreateAccount': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateAccount,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountResponse.SerializeToString,
+            ),
+            'ListAccounts': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListAccounts,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsResponse.SerializeToString,
+            ),
+            'SendMessage': grpc.unary_unary_rpc_method_handler(
+                    servicer.SendMessage,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageResponse.SerializeToString,
+            ),
+            'DeliverUndeliveredMessages': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeliverUndeliveredMessages,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesResponse.SerializeToString,
+            ),
+            'DeleteAccount': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteAccount,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountResponse.SerializeToString,
+            ),
+            'LogOutAccount': grpc.unary_unary_rpc_method_handler(
+                    servicer.LogOutAccount,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountResponse.SerializeToString,
+            ),
+            'AcknowledgeMessages': grpc.unary_unary_rpc_method_handler(
+                    servicer.AcknowledgeMessages,
+                    request_deserializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesRequest.FromString,
+                    response_serializer=chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'chat.Chat', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('chat.Chat', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Chat:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def LogInAccount(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/LogInAccount',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogInAccountResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateAccount(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/CreateAccount',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.CreateAccountResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListAccounts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/ListAccounts',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.ListAccountsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SendMessage(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/SendMessage',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.SendMessageResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeliverUndeliveredMessages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/DeliverUndeliveredMessages',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeliverUndeliveredMessagesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteAccount(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/DeleteAccount',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.DeleteAccountResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def LogOutAccount(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/LogOutAccount',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.LogOutAccountResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AcknowledgeMessages(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/chat.Chat/AcknowledgeMessages',
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesRequest.SerializeToString,
+            chat_dot_grpc_dot_grpcio_dot_proto__pb2.AcknowledgeMessagesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -1,9 +1,12 @@
 # tests.py
 
+from chat.common import models
+from chat.common.client import events as client_events
 from chat.common.config import Config
 from chat.common.models import Message, Account
 from chat.common.operations import Opcode
 from chat.common.server.database import Database
+from chat.common.util import Model
 from chat.grpc.client.main import (
     entry as grpc_client_entry,
     request as grpc_client_request,
@@ -15,9 +18,12 @@ from chat.wire.client.main import (
 )
 from chat.wire.server.main import main as wire_server_main
 from enum import Enum
+from io import StringIO
 from threading import Thread
 from time import sleep
+from types import SimpleNamespace
 
+import builtins
 import pytest
 
 
@@ -35,6 +41,53 @@ class TestData():
     username2 = "username2"
 
 
+# the request / response models, by name.
+MODELS = {n: m for n, m in vars(models).items()
+          if n.endswith(('Request', 'Response')) and not n.startswith('Base')}
+
+
+def model_example(model: type):
+    """An instance of `model` with every field set (to something other than
+        its default, bar `opcode`).
+    """
+    obj = model()
+    for name, t in model._fields.items():
+        if name == 'opcode':
+            continue
+        match t:
+            case builtins.bool:
+                val = True
+            case builtins.int:
+                val = 7
+            case builtins.str:
+                val = TestData.message
+            case builtins.list:
+                nested = model._fields_list_nested[name]
+                val = [model_example(nested), model_example(nested)]
+        getattr(obj, f'set_{name!s}')(val)
+    return obj
+
+
+def client_transcript(tty: bool, lines: str, monkeypatch, capsys):
+    """Drive the client `main` through `lines` as its stdin (looking like a
+        TTY if `tty`), with every request succeeding. Gives back the
+        transcript and the error it was ended by.
+    """
+    errors = []
+    stdin = StringIO(lines)
+    stdin.isatty = lambda: tty
+    monkeypatch.setattr('sys.stdin', stdin)
+    monkeypatch.setattr(Config, 'POLL_TIME', 60)
+    client_events.main(entry=lambda **kwargs: kwargs,
+                       request=lambda **kwargs: SimpleNamespace(
+                           get_accounts=lambda: [Account(
+                               logged_in=True,
+                               username=TestData.username)],
+                           get_error=lambda: ''),
+                       handler=lambda err=None, **kwargs: errors.append(err))
+    return capsys.readouterr().out, errors
+
+
 def start_client(chat: Chat, host="localhost", port=Config.PORT):
     match chat:
         case Chat.GRPC:
@@ -361,3 +414,69 @@ def test_log_out_account_error(chat: Chat, kwargs):
 
     response = log_out_account(chat, **kwargs)
     assert (len(response.get_error()) != 0)
+
+
+def test_model_underscore_fields():
+    model = Model.model_with_fields(_id=int, name=str)
+    obj = model(_id=3, name='a')
+
+    assert (obj.get__id() == 3)
+    assert (str(obj) == '_id: 3,name: a')
+    assert (obj == obj)
+    assert (model.deserialize(obj.serialize()) == obj)
+    assert (obj.as_model(model) == obj)
+    assert (model.from_grpc_model(SimpleNamespace(_id=3, name='a')) == obj)
+
+
+def test_model_cache():
+    model = Model.model_with_fields(field_defaults={'x': 1}, x=int)
+
+    assert (Model.model_with_fields(field_defaults={'x': 1}, x=int)
+            is model)
+    assert (Model.model_with_fields(x=int) is not model)
+    assert (Model.model_with_fields(field_defaults={'x': 2}, x=int)
+            is not model)
+
+    # equal defaults of different types are different models.
+    for default in [True, 1.0]:
+        other = Model.model_with_fields(field_defaults={'x': default}, x=int)
+        assert (other is not model)
+        assert (type(other().get_x()) is type(default))
+    assert (type(model().get_x()) is int)
+
+    # defaults which can't be cached on give a new model every time.
+    assert (Model.model_with_fields(field_defaults={'x': []},
+                                    fields_list_nested={'x': int},
+                                    x=list)
+            is not Model.model_with_fields(field_defaults={'x': []},
+                                           fields_list_nested={'x': int},
+                                           x=list))
+
+
+@pytest.mark.parametrize("model", MODELS.values(), ids=MODELS.keys())
+def test_model_round_trip(model: type):
+    obj = model_example(model)
+
+    assert (model.deserialize(obj.serialize()) == obj)
+
+
+@pytest.mark.parametrize("fields", [{'not an identifier': int},
+                                    {'private_fields': int},
+                                    {'order_of_fields': ['y'], 'x': int}])
+def test_model_with_fields_error(fields):
+    with pytest.raises(ValueError):
+        Model.model_with_fields(**fields)
+
+
+def test_client_main_piped(monkeypatch, capsys):
+    lines = f'3\n1\n{TestData.username!s}\n7\n1\n*\n'
+    piped, piped_errors = client_transcript(False, lines, monkeypatch, capsys)
+    tty, tty_errors = client_transcript(True, lines, monkeypatch, capsys)
+
+    assert (piped == tty)
+    assert ('Login succesful!' in piped)
+    assert (f'{TestData.username!s} (active: True)' in piped)
+
+    # the end of input ends the session.
+    assert ([type(err) for err in piped_errors] == [EOFError])
+    assert ([type(err) for err in tty_errors] == [EOFError])